@@ -1,19 +1,31 @@
-from fastapi import FastAPI, HTTPException, Depends, Query
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Dict, Callable, Iterator
+from collections import defaultdict
+from contextlib import contextmanager, ExitStack
+from functools import lru_cache
 import sqlite3
 import hashlib
+import logging
 import os
-from datetime import datetime, date
+import queue
+import threading
+import time
+from datetime import datetime, date, timedelta
+import anyio
+import blake3
+import orjson
 import uvicorn
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Anthony's Musings API",
     description="API for managing creative writing content",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -28,6 +40,49 @@ app.add_middleware(
 # Database configuration
 DATABASE_PATH = os.getenv("DATABASE_PATH", "/app/database/anthonys_musings.db")
 
+# Connection pool configuration
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", min(32, (os.cpu_count() or 1) * 4)))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+
+# Endpoints are sync and run on the anyio threadpool (default 40 threads)
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "200"))
+
+# WAL lets readers proceed during update_writing, but its -wal/-shm files live
+# next to the database, so it is only safe when every process opening the
+# database sees the same directory (mount the directory, not just the file)
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "DELETE").upper()
+
+# Applied once per pooled connection instead of on every request
+CONNECTION_PRAGMAS = [
+    f"journal_mode={SQLITE_JOURNAL_MODE}",
+    # NORMAL only skips fsyncs safely in WAL mode
+    "synchronous=NORMAL" if SQLITE_JOURNAL_MODE == "WAL" else "synchronous=FULL",
+    "cache_size=-131072",       # 128 MB page cache
+    "mmap_size=1073741824",     # read pages straight from the OS page cache
+    "temp_store=MEMORY",
+    "foreign_keys=ON",
+    "cache_spill=false",
+]
+
+# Prepared statements kept per pooled connection (sqlite3 defaults to 128)
+SQLITE_STATEMENT_CACHE_SIZE = 256
+
+# Read-mostly responses (/api/stats, /api/tags, /health) are memoized until
+# the next write or for CACHE_MAX_AGE seconds, whichever comes first
+CACHE_MAX_AGE = int(os.getenv("CACHE_MAX_AGE", "60"))
+
+# HTTP caching for list and aggregate responses, single writings (always
+# revalidated so edits show up immediately) and the health probe
+LIST_CACHE_CONTROL = f"public, max-age={CACHE_MAX_AGE}, stale-while-revalidate=300"
+ITEM_CACHE_CONTROL = "public, max-age=0, must-revalidate"
+HEALTH_CACHE_CONTROL = "no-cache"
+
+# Rows fetched, tagged and encoded per step when streaming list responses
+STREAM_BATCH_SIZE = 200
+
+# Stay below SQLite's default SQLITE_MAX_VARIABLE_NUMBER (999) when expanding IN (...)
+MAX_QUERY_PARAMS = 900
+
 # Pydantic models
 class WritingBase(BaseModel):
     title: str
@@ -68,10 +123,11 @@ class WritingDetail(BaseModel):
 
 class PaginatedResponse(BaseModel):
     items: List[WritingDetail]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None
     limit: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 class DatabaseStats(BaseModel):
     total_writings: int
@@ -81,20 +137,155 @@ class DatabaseStats(BaseModel):
     publication_status_distribution: dict
     top_tags: List[dict]
 
-# Database connection
-def get_db_connection():
+# Database connection pool
+_connection_pool: Optional[queue.Queue] = None
+_connection_pool_lock = threading.Lock()
+
+def create_db_connection() -> sqlite3.Connection:
+    """Open a connection configured for sharing across worker threads"""
+    conn = sqlite3.connect(
+        DATABASE_PATH,
+        check_same_thread=False,
+        cached_statements=SQLITE_STATEMENT_CACHE_SIZE
+    )
+    conn.row_factory = sqlite3.Row
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(f"PRAGMA {pragma}")
+    return conn
+
+def init_connection_pool() -> queue.Queue:
+    """Pre-open DB_POOL_SIZE connections so requests never pay for connect()"""
+    global _connection_pool
+    with _connection_pool_lock:
+        if _connection_pool is not None:
+            return _connection_pool
+        
+        pool = queue.Queue(maxsize=DB_POOL_SIZE)
+        try:
+            for _ in range(DB_POOL_SIZE):
+                pool.put(create_db_connection())
+        except Exception:
+            while not pool.empty():
+                pool.get_nowait().close()
+            raise
+        
+        _connection_pool = pool
+        return pool
+
+def close_connection_pool():
+    """Close every idle pooled connection; borrowed ones are closed on return"""
+    global _connection_pool
+    with _connection_pool_lock:
+        pool, _connection_pool = _connection_pool, None
+        while pool is not None and not pool.empty():
+            pool.get_nowait().close()
+
+@contextmanager
+def pooled_connection():
+    """Borrow a connection from the pool and hand it back when done"""
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
-        conn.row_factory = sqlite3.Row
-        return conn
+        pool = init_connection_pool()
+        conn = pool.get(timeout=DB_POOL_TIMEOUT)
+    except queue.Empty:
+        raise HTTPException(status_code=503, detail="Database connection pool exhausted")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database connection failed: {str(e)}")
+    
+    try:
+        yield conn
+    finally:
+        if conn.in_transaction:
+            conn.rollback()
+        # Return to the pool it came from, unless that pool has been retired
+        with _connection_pool_lock:
+            if pool is _connection_pool:
+                pool.put_nowait(conn)
+            else:
+                conn.close()
+
+def get_conn():
+    """FastAPI dependency yielding a pooled connection"""
+    with pooled_connection() as conn:
+        yield conn
+
+# Response cache
+# Distinguishes this process's ETags from those handed out before a restart
+_cache_epoch = f"{os.getpid()}-{time.time()}"
+_data_version = 0
+_data_version_lock = threading.Lock()
+_response_cache: Dict[str, tuple] = {}
+
+def invalidate_cached_responses():
+    """Mark every memoized response stale; call after writing to the database"""
+    global _data_version
+    with _data_version_lock:
+        _data_version += 1
+
+def weak_etag(*parts) -> str:
+    """Weak ETag over parts plus the current data version"""
+    digest = hashlib.md5(repr((_cache_epoch, _data_version) + parts).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+def writing_etag(row: sqlite3.Row, tags: List[Tag]) -> str:
+    """Weak ETag over every column of a writing row and its tags"""
+    tag_parts = sorted((tag.id, tag.name, tag.tag_type) for tag in tags)
+    digest = hashlib.md5(repr((tuple(row), tag_parts)).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak If-None-Match comparison against etag; "*" matches any etag, so
+    only call this once the resource is known to exist"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    
+    def opaque(tag):
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+    
+    return opaque(etag) in {opaque(tag) for tag in header.split(",")}
+
+def cached_json_response(
+    request: Request,
+    key: str,
+    compute: Callable[[], dict],
+    cache_control: str = LIST_CACHE_CONTROL
+) -> Response:
+    """Serve compute() from the cache with ETag / Cache-Control headers"""
+    version = _data_version
+    cached = _response_cache.get(key)
+    
+    if cached is None or cached[0] != version or time.monotonic() - cached[1] > CACHE_MAX_AGE:
+        content = compute()
+        etag = f'"{hashlib.md5(repr(content).encode()).hexdigest()}"'
+        cached = (version, time.monotonic(), content, etag)
+        _response_cache[key] = cached
+    
+    _, _, content, etag = cached
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    
+    return ORJSONResponse(content=content, headers=headers)
 
 # Helper functions
 def calculate_content_hash(content: str) -> str:
     """Calculate MD5 hash of content for duplicate detection"""
     return hashlib.md5(content.encode('utf-8')).hexdigest()
 
+def calculate_content_hash_b3(content: str) -> str:
+    """Calculate BLAKE3 hash of content, stored alongside the MD5 content_hash"""
+    return blake3.blake3(content.encode('utf-8')).hexdigest()
+
+def calculate_content_stats(content: str) -> tuple:
+    """Return (word_count, character_count, line_count) for content"""
+    word_count = len(content.split())
+    line_count = sum(1 for line in content.split('\n') if line.strip())
+    return word_count, len(content), line_count
+
 def get_writing_tags(conn, writing_id: int) -> List[Tag]:
     """Get tags for a specific writing"""
     cursor = conn.cursor()
@@ -108,6 +299,33 @@ def get_writing_tags(conn, writing_id: int) -> List[Tag]:
     return [Tag(id=row['id'], name=row['name'], tag_type=row['tag_type']) 
             for row in cursor.fetchall()]
 
+@lru_cache(maxsize=None)
+def writing_tags_query(id_count: int) -> str:
+    """SQL fetching the tags of id_count writings, memoized per placeholder count"""
+    placeholders = ", ".join("?" * id_count)
+    return f"""
+        SELECT wt.writing_id, t.id, t.name, t.tag_type
+        FROM writing_tags wt
+        JOIN tags t ON t.id = wt.tag_id
+        WHERE wt.writing_id IN ({placeholders})
+    """
+
+def get_tag_dicts_for_writings(conn, writing_ids: List[int]) -> Dict[int, List[dict]]:
+    """Get tags for many writings at once as plain dicts, keyed by writing id"""
+    tags_by_id: Dict[int, List[dict]] = defaultdict(list)
+    cursor = conn.cursor()
+    
+    for start in range(0, len(writing_ids), MAX_QUERY_PARAMS):
+        chunk = writing_ids[start:start + MAX_QUERY_PARAMS]
+        cursor.execute(writing_tags_query(len(chunk)), chunk)
+        
+        for row in cursor.fetchall():
+            tags_by_id[row['writing_id']].append(
+                {"id": row['id'], "name": row['name'], "tag_type": row['tag_type']}
+            )
+    
+    return tags_by_id
+
 def row_to_writing(row, tags: List[Tag] = None) -> WritingDetail:
     """Convert database row to WritingDetail object"""
     return WritingDetail(
@@ -126,6 +344,102 @@ def row_to_writing(row, tags: List[Tag] = None) -> WritingDetail:
         tags=tags or []
     )
 
+def row_to_writing_dict(row, tags: List[dict]) -> dict:
+    """Convert database row to a WritingDetail-shaped dict, skipping validation"""
+    return {
+        "id": row['id'],
+        "title": row['title'],
+        "content_type": row['content_type'],
+        "content": row['content'],
+        "word_count": row['word_count'],
+        "character_count": row['character_count'],
+        "line_count": row['line_count'],
+        "mood": row['mood'],
+        "explicit_content": bool(row['explicit_content']),
+        "publication_status": row['publication_status'],
+        "notes": row['notes'],
+        "file_timestamp": row['file_timestamp'],
+        "tags": tags
+    }
+
+def rows_to_writing_dicts(conn, rows) -> List[dict]:
+    """Convert database rows to WritingDetail-shaped dicts with one batched tag lookup"""
+    tags_by_id = get_tag_dicts_for_writings(conn, [row['id'] for row in rows])
+    return [row_to_writing_dict(row, tags_by_id[row['id']]) for row in rows]
+
+def paginated_json_response(
+    items: List[dict],
+    total: int,
+    page: int,
+    limit: int,
+    pages: int,
+    headers: Optional[dict] = None
+) -> ORJSONResponse:
+    """Serialize a PaginatedResponse-shaped payload straight to JSON"""
+    return ORJSONResponse(content={
+        "items": items,
+        "total": total,
+        "page": page,
+        "limit": limit,
+        "pages": pages,
+        "next_cursor": None
+    }, headers=headers)
+
+def stream_writings_page(
+    conn,
+    db_cursor,
+    limit: int,
+    metadata: dict,
+    release: Callable[[], None]
+) -> Iterator[bytes]:
+    """Yield a PaginatedResponse JSON document, encoding rows batch by batch as they are fetched"""
+    try:
+        yield b'{"items":['
+        
+        row_count = 0
+        last_row = None
+        while True:
+            rows = db_cursor.fetchmany(STREAM_BATCH_SIZE)
+            if not rows:
+                break
+            
+            tags_by_id = get_tag_dicts_for_writings(conn, [row['id'] for row in rows])
+            chunk = b",".join(
+                orjson.dumps(row_to_writing_dict(row, tags_by_id[row['id']])) for row in rows
+            )
+            yield (b"," if row_count else b"") + chunk
+            
+            row_count += len(rows)
+            last_row = rows[-1]
+        
+        metadata["next_cursor"] = (
+            encode_cursor(last_row['id'], last_row['file_timestamp']) if row_count == limit else None
+        )
+        # Splice the metadata object's members in after the items array
+        yield b"]," + orjson.dumps(metadata)[1:]
+    except Exception:
+        # The response's background task is skipped when the body fails
+        release()
+        raise
+
+# Lifecycle hooks
+
+@app.on_event("startup")
+async def raise_threadpool_limit():
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
+@app.on_event("startup")
+def open_database_pool():
+    try:
+        init_connection_pool()
+    except sqlite3.Error as e:
+        # Leave the pool to be opened lazily so /health can report the problem
+        logging.getLogger(__name__).warning("Database connection pool not initialized: %s", e)
+
+@app.on_event("shutdown")
+def close_database_pool():
+    close_connection_pool()
+
 # API Endpoints
 
 @app.get("/")
@@ -133,99 +447,178 @@ async def root():
     return {"message": "Anthony's Musings API", "version": "1.0.0"}
 
 @app.get("/health")
-async def health_check():
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM writings")
-        count = cursor.fetchone()[0]
-        conn.close()
+def health_check(request: Request):
+    def compute():
+        with pooled_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM writings")
+            count = cursor.fetchone()[0]
         return {"status": "healthy", "database": "connected", "total_writings": count}
+    
+    try:
+        return cached_json_response(request, "health", compute, HEALTH_CACHE_CONTROL)
     except Exception as e:
         return {"status": "unhealthy", "error": str(e)}
 
-@app.get("/api/writings", response_model=PaginatedResponse)
-async def get_writings(
-    page: int = Query(1, ge=1),
-    limit: int = Query(20, ge=1, le=1000),
-    content_type: Optional[str] = None,
-    publication_status: Optional[str] = None,
-    explicit: bool = Query(False)
-):
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Build WHERE clause
+# get_writings filters, combined as a bitmask into WRITINGS_QUERIES keys
+FILTER_CONTENT_TYPE = 1
+FILTER_PUBLICATION_STATUS = 2
+FILTER_HIDE_EXPLICIT = 4
+
+def build_writings_queries(shape: int) -> tuple:
+    """Build the (count, latest, offset page, keyset page) SQL for one combination of get_writings filters"""
     where_conditions = []
-    params = []
     
-    if content_type:
+    if shape & FILTER_CONTENT_TYPE:
         where_conditions.append("content_type = ?")
-        params.append(content_type)
     
-    if publication_status:
+    if shape & FILTER_PUBLICATION_STATUS:
         where_conditions.append("publication_status = ?")
-        params.append(publication_status)
     
-    if not explicit:
+    if shape & FILTER_HIDE_EXPLICIT:
         where_conditions.append("explicit_content = 0")
     
     where_clause = "WHERE " + " AND ".join(where_conditions) if where_conditions else ""
+    keyset_clause = "WHERE " + " AND ".join(where_conditions + ["(file_timestamp, id) < (?, ?)"])
     
-    # Get total count
-    count_query = f"SELECT COUNT(*) FROM writings {where_clause}"
-    cursor.execute(count_query, params)
-    total = cursor.fetchone()[0]
-    
-    # Get paginated results
-    offset = (page - 1) * limit
+    # The count and latest-timestamp queries double as ETag validators
+    count_query = f"SELECT COUNT(*), MAX(file_timestamp) FROM writings {where_clause}"
+    latest_query = f"SELECT MAX(file_timestamp) FROM writings {where_clause}"
     query = f"""
         SELECT * FROM writings {where_clause}
-        ORDER BY file_timestamp DESC
+        ORDER BY file_timestamp DESC, id DESC
         LIMIT ? OFFSET ?
     """
-    cursor.execute(query, params + [limit, offset])
-    
-    writings = []
-    for row in cursor.fetchall():
-        tags = get_writing_tags(conn, row['id'])
-        writings.append(row_to_writing(row, tags))
-    
-    conn.close()
-    
-    pages = (total + limit - 1) // limit
-    
-    return PaginatedResponse(
-        items=writings,
-        total=total,
-        page=page,
-        limit=limit,
-        pages=pages
+    keyset_query = f"""
+        SELECT * FROM writings {keyset_clause}
+        ORDER BY file_timestamp DESC, id DESC
+        LIMIT ?
+    """
+    return count_query, latest_query, query, keyset_query
+
+# Identical SQL text per shape keeps each connection's statement cache hot
+WRITINGS_QUERIES = {shape: build_writings_queries(shape) for shape in range(8)}
+
+def encode_cursor(writing_id: int, file_timestamp: str) -> str:
+    """Opaque keyset cursor pointing just past the given writing"""
+    return f"{writing_id}:{file_timestamp}"
+
+def decode_cursor(cursor: str) -> tuple:
+    """Split a cursor from encode_cursor into (file_timestamp, id)"""
+    writing_id, sep, file_timestamp = cursor.partition(":")
+    if not sep or not writing_id.isdigit():
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return file_timestamp, int(writing_id)
+
+@app.get("/api/writings", response_model=PaginatedResponse)
+def get_writings(
+    request: Request,
+    page: int = Query(1, ge=1),
+    limit: int = Query(20, ge=1, le=1000),
+    content_type: Optional[str] = None,
+    publication_status: Optional[str] = None,
+    explicit: bool = Query(False),
+    cursor: Optional[str] = None,
+    count: Optional[bool] = None
+):
+    # Page-number requests are counted by default for existing clients;
+    # cursor requests skip the COUNT(*) unless asked for it
+    if count is None:
+        count = cursor is None
+    
+    # The connection is held until the streamed body is finished or abandoned,
+    # so it is borrowed here rather than through a request-scoped dependency
+    with ExitStack() as resources:
+        conn = resources.enter_context(pooled_connection())
+        db_cursor = conn.cursor()
+        # Closing the cursor ends its read snapshot before the connection is reused
+        resources.callback(db_cursor.close)
+        
+        # Look up the pre-built SQL for this combination of filters
+        shape = 0
+        params = []
+        
+        if content_type:
+            shape |= FILTER_CONTENT_TYPE
+            params.append(content_type)
+        
+        if publication_status:
+            shape |= FILTER_PUBLICATION_STATUS
+            params.append(publication_status)
+        
+        if not explicit:
+            shape |= FILTER_HIDE_EXPLICIT
+        
+        count_query, latest_query, query, keyset_query = WRITINGS_QUERIES[shape]
+        
+        # Get total count and the newest timestamp, which together validate the ETag
+        total = None
+        if count:
+            db_cursor.execute(count_query, params)
+            total, latest = db_cursor.fetchone()
+        else:
+            db_cursor.execute(latest_query, params)
+            latest = db_cursor.fetchone()[0]
+        
+        headers = {"ETag": weak_etag(latest, total), "Cache-Control": LIST_CACHE_CONTROL}
+        if etag_matches(request, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        
+        # Get the next page, either after the cursor or by offset
+        if cursor is not None:
+            db_cursor.execute(keyset_query, params + list(decode_cursor(cursor)) + [limit])
+        else:
+            offset = (page - 1) * limit
+            db_cursor.execute(query, params + [limit, offset])
+        
+        # From here the stream owns the cursor and connection; the background
+        # task releases them once the body is sent or the client disconnects
+        release = resources.pop_all().close
+    
+    metadata = {
+        "total": total,
+        "page": page if cursor is None else None,
+        "limit": limit,
+        "pages": (total + limit - 1) // limit if total is not None else None,
+    }
+    return StreamingResponse(
+        stream_writings_page(conn, db_cursor, limit, metadata, release),
+        media_type="application/json",
+        headers=headers,
+        background=BackgroundTask(release)
     )
 
 @app.get("/api/writings/today", response_model=PaginatedResponse)
-async def get_todays_writings(
+def get_todays_writings(
+    request: Request,
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=1000),
-    explicit: bool = Query(False)
+    explicit: bool = Query(False),
+    conn: sqlite3.Connection = Depends(get_conn)
 ):
-    conn = get_db_connection()
     cursor = conn.cursor()
     
-    today = date.today().isoformat()
+    # A range on the raw column can use idx_writings_file_timestamp and
+    # avoids evaluating date() for every row
+    today = date.today()
+    tomorrow = today + timedelta(days=1)
     
-    where_conditions = ["date(file_timestamp) = ?"]
-    params = [today]
+    where_conditions = ["file_timestamp >= ?", "file_timestamp < ?"]
+    params = [today.isoformat(), tomorrow.isoformat()]
     
     if not explicit:
         where_conditions.append("explicit_content = 0")
     
     where_clause = "WHERE " + " AND ".join(where_conditions)
     
-    # Get total count
-    count_query = f"SELECT COUNT(*) FROM writings {where_clause}"
+    # Get total count and the newest timestamp, which together validate the ETag
+    count_query = f"SELECT COUNT(*), MAX(file_timestamp) FROM writings {where_clause}"
     cursor.execute(count_query, params)
-    total = cursor.fetchone()[0]
+    total, latest = cursor.fetchone()
+    
+    headers = {"ETag": weak_etag(today.isoformat(), latest, total), "Cache-Control": LIST_CACHE_CONTROL}
+    if etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
     
     # Get paginated results
     offset = (page - 1) * limit
@@ -236,86 +629,88 @@ async def get_todays_writings(
     """
     cursor.execute(query, params + [limit, offset])
     
-    writings = []
-    for row in cursor.fetchall():
-        tags = get_writing_tags(conn, row['id'])
-        writings.append(row_to_writing(row, tags))
-    
-    conn.close()
+    writings = rows_to_writing_dicts(conn, cursor.fetchall())
     
     pages = (total + limit - 1) // limit
     
-    return PaginatedResponse(
-        items=writings,
-        total=total,
-        page=page,
-        limit=limit,
-        pages=pages
-    )
+    return paginated_json_response(writings, total, page, limit, pages, headers=headers)
 
 @app.get("/api/writings/type/{content_type}", response_model=PaginatedResponse)
-async def get_writings_by_type(
+def get_writings_by_type(
+    request: Request,
     content_type: str,
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=1000),
-    explicit: bool = Query(False)
+    explicit: bool = Query(False),
+    cursor: Optional[str] = None,
+    count: Optional[bool] = None
 ):
-    return await get_writings(page=page, limit=limit, content_type=content_type, explicit=explicit)
+    return get_writings(
+        request=request,
+        page=page,
+        limit=limit,
+        content_type=content_type,
+        publication_status=None,
+        explicit=explicit,
+        cursor=cursor,
+        count=count
+    )
 
 @app.get("/api/writings/chapters", response_model=PaginatedResponse)
-async def get_chapters(
+def get_chapters(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=1000),
-    explicit: bool = Query(False)
+    explicit: bool = Query(False),
+    conn: sqlite3.Connection = Depends(get_conn)
 ):
-    conn = get_db_connection()
     cursor = conn.cursor()
     
+    # The FTS index covers title and content case-insensitively; the prefix
+    # query also matches "chapters" like the old LIKE '%chapter%' scan did
     where_conditions = [
-        "(content_type = 'prose' OR content_type = 'fragment')",
-        "(LOWER(content) LIKE '%chapter%' OR LOWER(title) LIKE '%chapter%')"
+        "writings_fts MATCH ?",
+        "(w.content_type = 'prose' OR w.content_type = 'fragment')"
     ]
-    params = []
+    params = ["chapter*"]
     
     if not explicit:
-        where_conditions.append("explicit_content = 0")
+        where_conditions.append("w.explicit_content = 0")
     
     where_clause = "WHERE " + " AND ".join(where_conditions)
     
     # Get total count
-    count_query = f"SELECT COUNT(*) FROM writings {where_clause}"
+    count_query = f"""
+        SELECT COUNT(*) FROM writings_fts
+        JOIN writings w ON writings_fts.rowid = w.id
+        {where_clause}
+    """
     cursor.execute(count_query, params)
     total = cursor.fetchone()[0]
     
     # Get paginated results
     offset = (page - 1) * limit
     query = f"""
-        SELECT * FROM writings {where_clause}
-        ORDER BY file_timestamp DESC
+        SELECT w.* FROM writings_fts
+        JOIN writings w ON writings_fts.rowid = w.id
+        {where_clause}
+        ORDER BY w.file_timestamp DESC
         LIMIT ? OFFSET ?
     """
     cursor.execute(query, params + [limit, offset])
     
-    writings = []
-    for row in cursor.fetchall():
-        tags = get_writing_tags(conn, row['id'])
-        writings.append(row_to_writing(row, tags))
-    
-    conn.close()
+    writings = rows_to_writing_dicts(conn, cursor.fetchall())
     
     pages = (total + limit - 1) // limit
     
-    return PaginatedResponse(
-        items=writings,
-        total=total,
-        page=page,
-        limit=limit,
-        pages=pages
-    )
+    return paginated_json_response(writings, total, page, limit, pages)
 
 @app.get("/api/writings/{writing_id}", response_model=WritingDetail)
-async def get_writing(writing_id: int):
-    conn = get_db_connection()
+def get_writing(
+    writing_id: int,
+    request: Request,
+    response: Response,
+    conn: sqlite3.Connection = Depends(get_conn)
+):
     cursor = conn.cursor()
     
     cursor.execute("SELECT * FROM writings WHERE id = ?", (writing_id,))
@@ -325,23 +720,26 @@ async def get_writing(writing_id: int):
         raise HTTPException(status_code=404, detail="Writing not found")
     
     tags = get_writing_tags(conn, writing_id)
+    
+    # Validate against the stored row and tags so edits made outside this
+    # process change the ETag too; a match only skips serialization
+    headers = {"ETag": writing_etag(row, tags), "Cache-Control": ITEM_CACHE_CONTROL}
+    if etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    
     writing = row_to_writing(row, tags)
     
-    conn.close()
+    response.headers.update(headers)
     return writing
 
 @app.put("/api/writings/{writing_id}", response_model=WritingDetail)
-async def update_writing(writing_id: int, writing_update: WritingUpdate):
-    conn = get_db_connection()
+def update_writing(
+    writing_id: int,
+    writing_update: WritingUpdate,
+    conn: sqlite3.Connection = Depends(get_conn)
+):
     cursor = conn.cursor()
     
-    # Check if writing exists
-    cursor.execute("SELECT * FROM writings WHERE id = ?", (writing_id,))
-    existing = cursor.fetchone()
-    
-    if not existing:
-        raise HTTPException(status_code=404, detail="Writing not found")
-    
     # Build update query
     update_fields = []
     params = []
@@ -360,12 +758,12 @@ async def update_writing(writing_id: int, writing_update: WritingUpdate):
         update_fields.append("character_count = ?")
         update_fields.append("line_count = ?")
         update_fields.append("content_hash = ?")
+        update_fields.append("content_hash_b3 = ?")
         
         params.append(writing_update.content)
-        params.append(len(writing_update.content.split()))
-        params.append(len(writing_update.content))
-        params.append(len([l for l in writing_update.content.split('\n') if l.strip()]))
+        params.extend(calculate_content_stats(writing_update.content))
         params.append(calculate_content_hash(writing_update.content))
+        params.append(calculate_content_hash_b3(writing_update.content))
     
     if writing_update.notes is not None:
         update_fields.append("notes = ?")
@@ -378,29 +776,34 @@ async def update_writing(writing_id: int, writing_update: WritingUpdate):
     if not update_fields:
         raise HTTPException(status_code=400, detail="No fields to update")
     
-    # Execute update
-    update_query = f"UPDATE writings SET {', '.join(update_fields)} WHERE id = ?"
+    # Execute update and read back the updated row in the same statement;
+    # no row back means the writing does not exist
+    update_query = f"UPDATE writings SET {', '.join(update_fields)} WHERE id = ? RETURNING *"
     params.append(writing_id)
     
     cursor.execute(update_query, params)
+    rows = cursor.fetchall()
+    
+    if not rows:
+        raise HTTPException(status_code=404, detail="Writing not found")
+    
     conn.commit()
+    invalidate_cached_responses()
     
-    # Return updated writing
-    cursor.execute("SELECT * FROM writings WHERE id = ?", (writing_id,))
-    row = cursor.fetchone()
+    row = rows[0]
     tags = get_writing_tags(conn, writing_id)
     writing = row_to_writing(row, tags)
     
-    conn.close()
     return writing
 
 @app.get("/api/search", response_model=PaginatedResponse)
-async def search_writings(
+def search_writings(
     q: str = Query(..., min_length=1),
     limit: int = Query(20, ge=1, le=1000),
-    include_explicit: bool = Query(False)
+    include_explicit: bool = Query(False),
+    include_tags: bool = Query(False),
+    conn: sqlite3.Connection = Depends(get_conn)
 ):
-    conn = get_db_connection()
     cursor = conn.cursor()
     
     # Use FTS for search
@@ -412,8 +815,9 @@ async def search_writings(
     
     where_clause = "WHERE " + " AND ".join(where_conditions)
     
+    # rank is FTS5's bm25() score; snippets are not part of the response
     query = f"""
-        SELECT w.*, snippet(writings_fts, 1, '<b>', '</b>', '...', 32) as snippet
+        SELECT w.*
         FROM writings_fts 
         JOIN writings w ON writings_fts.rowid = w.id
         {where_clause}
@@ -422,45 +826,50 @@ async def search_writings(
     """
     
     cursor.execute(query, params + [limit])
+    rows = cursor.fetchall()
     
-    writings = []
-    for row in cursor.fetchall():
-        tags = get_writing_tags(conn, row['id'])
-        writing = row_to_writing(row, tags)
-        writings.append(writing)
+    if include_tags:
+        writings = rows_to_writing_dicts(conn, rows)
+    else:
+        writings = [row_to_writing_dict(row, []) for row in rows]
     
-    conn.close()
-    
-    return PaginatedResponse(
-        items=writings,
-        total=len(writings),
-        page=1,
-        limit=limit,
-        pages=1
-    )
+    return paginated_json_response(writings, len(writings), 1, limit, 1)
 
 @app.get("/api/stats", response_model=DatabaseStats)
-async def get_database_stats():
-    conn = get_db_connection()
-    cursor = conn.cursor()
+def get_database_stats(request: Request):
+    def compute():
+        with pooled_connection() as conn:
+            return compute_database_stats(conn).model_dump()
     
-    # Overall stats
-    cursor.execute("SELECT COUNT(*), SUM(word_count), AVG(word_count) FROM writings")
-    total, total_words, avg_words = cursor.fetchone()
+    return cached_json_response(request, "stats", compute)
+
+def compute_database_stats(conn) -> DatabaseStats:
+    """Aggregate corpus-wide statistics"""
+    cursor = conn.cursor()
     
-    # By content type
+    # Overall, per-type and per-status stats from a single scan, rolled up below
     cursor.execute("""
-        SELECT content_type, COUNT(*), 
+        SELECT content_type, publication_status, COUNT(*),
+               SUM(word_count), COUNT(word_count),
                SUM(CASE WHEN explicit_content = 1 THEN 1 ELSE 0 END) as explicit_count
-        FROM writings GROUP BY content_type ORDER BY COUNT(*) DESC
+        FROM writings GROUP BY content_type, publication_status
     """)
+    total = total_words = counted_words = 0
     content_type_dist = {}
-    for row in cursor.fetchall():
-        content_type_dist[row[0]] = {"count": row[1], "explicit": row[2]}
+    status_dist = {}
+    for content_type, status, count, words, word_rows, explicit_count in cursor.fetchall():
+        total += count
+        total_words += words or 0
+        counted_words += word_rows
+        
+        type_stats = content_type_dist.setdefault(content_type, {"count": 0, "explicit": 0})
+        type_stats["count"] += count
+        type_stats["explicit"] += explicit_count
+        
+        status_dist[status] = status_dist.get(status, 0) + count
     
-    # By status
-    cursor.execute("SELECT publication_status, COUNT(*) FROM writings GROUP BY publication_status")
-    status_dist = dict(cursor.fetchall())
+    content_type_dist = dict(sorted(content_type_dist.items(), key=lambda item: -item[1]["count"]))
+    avg_words = total_words / counted_words if counted_words else 0
     
     # Top tags
     cursor.execute("""
@@ -473,8 +882,6 @@ async def get_database_stats():
     """)
     top_tags = [{"name": row[0], "count": row[1]} for row in cursor.fetchall()]
     
-    conn.close()
-    
     return DatabaseStats(
         total_writings=total or 0,
         total_words=total_words or 0,
@@ -485,8 +892,15 @@ async def get_database_stats():
     )
 
 @app.get("/api/tags")
-async def get_tags():
-    conn = get_db_connection()
+def get_tags(request: Request):
+    def compute():
+        with pooled_connection() as conn:
+            return {"tags": compute_tag_usage(conn)}
+    
+    return cached_json_response(request, "tags", compute)
+
+def compute_tag_usage(conn) -> List[dict]:
+    """List every tag with the number of writings using it"""
     cursor = conn.cursor()
     
     cursor.execute("""
@@ -497,17 +911,9 @@ async def get_tags():
         ORDER BY usage_count DESC, t.name
     """)
     
-    tags = []
-    for row in cursor.fetchall():
-        tags.append({
-            "id": row[0],
-            "name": row[1],
-            "tag_type": row[2],
-            "usage_count": row[3]
-        })
-    
-    conn.close()
-    return {"tags": tags}
+    # Pooled connections return sqlite3.Row, whose column names already
+    # match the response keys
+    return [dict(row) for row in cursor.fetchall()]
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
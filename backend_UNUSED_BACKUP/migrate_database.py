@@ -8,8 +8,38 @@ import sqlite3
 import hashlib
 import sys
 import os
+from multiprocessing import Pool
 from datetime import datetime
 
+import blake3
+
+# Same journal mode as the API (see SQLITE_JOURNAL_MODE in main.py)
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "DELETE").upper()
+
+# Same connection settings as the API's pooled connections
+MIGRATION_PRAGMAS = [
+    f"journal_mode={SQLITE_JOURNAL_MODE}",
+    "synchronous=NORMAL" if SQLITE_JOURNAL_MODE == "WAL" else "synchronous=FULL",
+    "cache_size=-131072",
+    "mmap_size=1073741824",
+    "temp_store=MEMORY",
+    "foreign_keys=ON",
+]
+
+# Simple fingerprint (first 100 + last 100 chars), computed inside SQLite
+FINGERPRINT_SQL = """
+    CASE WHEN length(content) > 200
+         THEN substr(content, 1, 100) || '...' || substr(content, length(content) - 99, 100)
+         ELSE content
+    END
+"""
+
+# Records hashed and written per transaction during the content hash backfill
+HASH_BATCH_SIZE = 10_000
+
+# Records sent to a hashing worker process at a time
+HASH_WORKER_CHUNK_SIZE = 500
+
 def get_database_path():
     """Get database path from environment or default"""
     return os.getenv("DATABASE_PATH", "/app/database/anthonys_musings.db")
@@ -18,6 +48,15 @@ def calculate_content_hash(content):
     """Calculate MD5 hash of content"""
     return hashlib.md5(content.encode('utf-8')).hexdigest()
 
+def calculate_content_hash_b3(content):
+    """Calculate BLAKE3 hash of content"""
+    return blake3.blake3(content.encode('utf-8')).hexdigest()
+
+def hash_record(record):
+    """Worker: turn an (id, content) record into (content_hash, content_hash_b3, id)"""
+    record_id, content = record
+    return calculate_content_hash(content), calculate_content_hash_b3(content), record_id
+
 def migrate_database():
     """Run database migration"""
     db_path = get_database_path()
@@ -32,6 +71,11 @@ def migrate_database():
         conn = sqlite3.connect(db_path)
         cursor = conn.cursor()
         
+        # journal_mode persists in the file, so this also switches an existing
+        # database into (or back out of) WAL
+        for pragma in MIGRATION_PRAGMAS:
+            cursor.execute(f"PRAGMA {pragma}")
+        
         # Check current schema
         cursor.execute("PRAGMA table_info(writings)")
         columns = [column[1] for column in cursor.fetchall()]
@@ -41,6 +85,7 @@ def migrate_database():
         # Add new columns if they don't exist
         new_columns = [
             ("content_hash", "TEXT"),
+            ("content_hash_b3", "TEXT"),
             ("content_fingerprint", "TEXT"), 
             ("similarity_group_id", "INTEGER"),
             ("is_duplicate", "BOOLEAN DEFAULT 0"),
@@ -61,6 +106,10 @@ def migrate_database():
             ("idx_writings_similarity_group", "writings", "similarity_group_id"),
             ("idx_writings_is_duplicate", "writings", "is_duplicate"),
             ("idx_writings_today", "writings", "date(file_timestamp)"),
+            ("idx_writings_file_timestamp", "writings", "file_timestamp"),
+            ("idx_writings_explicit_listing", "writings", "explicit_content, file_timestamp"),
+            ("idx_writings_listing", "writings", "content_type, explicit_content, file_timestamp"),
+            ("idx_writings_status_listing", "writings", "publication_status, explicit_content, file_timestamp"),
             ("idx_writings_content_type", "writings", "content_type"),
             ("idx_writings_publication_status", "writings", "publication_status"),
         ]
@@ -72,24 +121,59 @@ def migrate_database():
             except sqlite3.Error as e:
                 print(f"  ⚠️  Index {index_name} may already exist: {e}")
         
-        # Populate content_hash for existing records
-        cursor.execute("SELECT id, content FROM writings WHERE content_hash IS NULL")
-        records_to_update = cursor.fetchall()
+        # Refresh planner statistics so the new indexes are actually chosen
+        cursor.execute("ANALYZE writings")
+        print("  📐 Analyzed writings table")
+        
+        # Populate content_fingerprint in one statement without loading content into Python
+        with conn:
+            cursor.execute(f"""
+                UPDATE writings SET content_fingerprint = {FINGERPRINT_SQL}
+                WHERE content_fingerprint IS NULL
+            """)
+        if cursor.rowcount:
+            print(f"  🧬 Created content fingerprints for {cursor.rowcount} records")
+            migrations_applied += cursor.rowcount
+        
+        # Populate both hashes for records missing either one. content_hash
+        # stays MD5 because other writers still produce it and
+        # potential_duplicates compares it across rows; content_hash_b3 is
+        # filled here and by the API, so rows from other writers catch up on
+        # the next migration run
+        needs_hash = "(content_hash IS NULL OR content_hash_b3 IS NULL)"
+        cursor.execute(f"SELECT COUNT(*) FROM writings WHERE {needs_hash}")
+        records_to_update = cursor.fetchone()[0]
         
         if records_to_update:
-            print(f"  🔍 Updating content hashes for {len(records_to_update)} records...")
-            for record_id, content in records_to_update:
-                content_hash = calculate_content_hash(content)
-                # Also create a simple fingerprint (first 100 + last 100 chars)
-                fingerprint = content[:100] + "..." + content[-100:] if len(content) > 200 else content
-                
-                cursor.execute("""
-                    UPDATE writings 
-                    SET content_hash = ?, content_fingerprint = ?
-                    WHERE id = ?
-                """, (content_hash, fingerprint, record_id))
+            print(f"  🔍 Updating content hashes for {records_to_update} records...")
+            conn.commit()
+            last_id = 0
             
-            migrations_applied += len(records_to_update)
+            # Hash in worker processes; only this process touches the database
+            with Pool(os.cpu_count()) as pool:
+                while True:
+                    cursor.execute(f"""
+                        SELECT id, content FROM writings
+                        WHERE {needs_hash} AND id > ?
+                        ORDER BY id
+                        LIMIT ?
+                    """, (last_id, HASH_BATCH_SIZE))
+                    batch = cursor.fetchall()
+                    if not batch:
+                        break
+                    
+                    updates = list(pool.imap_unordered(hash_record, batch, chunksize=HASH_WORKER_CHUNK_SIZE))
+                    
+                    with conn:
+                        cursor.executemany("""
+                            UPDATE writings 
+                            SET content_hash = ?, content_hash_b3 = ?
+                            WHERE id = ?
+                        """, updates)
+                    
+                    last_id = batch[-1][0]
+            
+            migrations_applied += records_to_update
         
         # Create useful views
         views = [
@@ -159,7 +243,7 @@ def verify_migration():
         cursor.execute("PRAGMA table_info(writings)")
         columns = [column[1] for column in cursor.fetchall()]
         
-        required_columns = ["content_hash", "similarity_group_id", "is_duplicate"]
+        required_columns = ["content_hash", "content_hash_b3", "similarity_group_id", "is_duplicate"]
         missing_columns = [col for col in required_columns if col not in columns]
         
         if missing_columns:
@@ -173,6 +257,41 @@ def verify_migration():
         if null_hashes > 0:
             print(f"⚠️  {null_hashes} writings missing content hashes")
         
+        cursor.execute("SELECT COUNT(*) FROM writings WHERE content_hash_b3 IS NULL")
+        null_b3_hashes = cursor.fetchone()[0]
+        
+        if null_b3_hashes > 0:
+            print(f"⚠️  {null_b3_hashes} writings missing BLAKE3 content hashes")
+        
+        # Check that the API's hot queries are answered from an index without
+        # a separate sort step
+        plan_checks = [
+            ("Today's writings", """
+                SELECT * FROM writings
+                WHERE file_timestamp >= ? AND file_timestamp < ?
+                ORDER BY file_timestamp DESC
+            """, ("2000-01-01", "2000-01-02")),
+            ("Writings by content type", """
+                SELECT * FROM writings
+                WHERE content_type = ? AND explicit_content = 0
+                ORDER BY file_timestamp DESC, id DESC
+            """, ("prose",)),
+            ("Writings by publication status", """
+                SELECT * FROM writings
+                WHERE publication_status = ? AND explicit_content = 0
+                ORDER BY file_timestamp DESC, id DESC
+            """, ("draft",)),
+        ]
+        
+        for description, query, params in plan_checks:
+            cursor.execute(f"EXPLAIN QUERY PLAN {query}", params)
+            plan = " ".join(row[-1] for row in cursor.fetchall())
+            
+            if "USING INDEX" not in plan and "USING COVERING INDEX" not in plan:
+                print(f"⚠️  {description} query is not using an index: {plan}")
+            elif "TEMP B-TREE" in plan:
+                print(f"⚠️  {description} query needs a temporary sort: {plan}")
+        
         cursor.execute("SELECT COUNT(*) FROM writings")
         total = cursor.fetchone()[0]
         
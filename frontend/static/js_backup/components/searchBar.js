@@ -57,7 +57,8 @@ window.SearchBar = {
             const results = await API.search({
                 q: query,
                 limit: 10,
-                include_explicit: window.app ? window.app.explicitContentEnabled : false
+                include_explicit: window.app ? window.app.explicitContentEnabled : false,
+                include_tags: true
             });
             
             this.displaySearchResults(results.items || []);
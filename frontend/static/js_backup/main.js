@@ -427,7 +427,8 @@ class MusingsApp {
             const results = await API.search({
                 q: query,
                 limit: 10,
-                include_explicit: this.explicitContentEnabled
+                include_explicit: this.explicitContentEnabled,
+                include_tags: true
             });
             
             this.displaySearchResults(results.items);
@@ -482,7 +483,8 @@ class MusingsApp {
             const results = await API.search({
                 q: query,
                 limit: 50,
-                include_explicit: this.explicitContentEnabled
+                include_explicit: this.explicitContentEnabled,
+                include_tags: true
             });
             
             this.displayAdvancedSearchResults(results);